@@ -21,3 +21,5 @@ from .workchains import ot_has_small_bandgap
 from .workchains import check_resize_unit_cell
 from .workchains import resize_unit_cell
 from .workchains import HARTREE2EV, HARTREE2KJMOL
+from .datatype_helpers import get_or_create_singlefile
+from .datatype_helpers import get_or_create_structure
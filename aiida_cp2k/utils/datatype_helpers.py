@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), The AiiDA-CP2K authors.                                      #
+# SPDX-License-Identifier: MIT                                                #
+# AiiDA-CP2K is hosted on GitHub at https://github.com/aiidateam/aiida-cp2k   #
+# For further information on the license, see the LICENSE.txt file.           #
+###############################################################################
+"""AiiDA-CP2K helpers to reuse already stored data nodes"""
+
+from __future__ import absolute_import
+
+import io
+import os
+import json
+import hashlib
+
+from aiida.orm import QueryBuilder, SinglefileData, StructureData
+
+SHA256_EXTRA = '_content_sha256'
+STRUCTURE_SHA256_EXTRA = '_structure_sha256'
+
+
+def get_file_sha256(path):
+    """Return the SHA-256 hex digest of the content of the file at ``path``"""
+    with io.open(path, mode='rb') as fobj:
+        return hashlib.sha256(fobj.read()).hexdigest()
+
+
+def get_or_create_singlefile(path):
+    """Return a stored SinglefileData with the content of the file at ``path``.
+
+    The node is looked up by the SHA-256 of the file content (and by the file name, since the
+    name is used when copying the file into the calculation folder). A new node is created,
+    stored and tagged only if no matching node exists yet.
+
+    :param path: path to the file on disk
+    :return: a stored `aiida.orm.SinglefileData` node
+    """
+    sha256 = get_file_sha256(path)
+    filename = os.path.basename(path)
+
+    qbuild = QueryBuilder()
+    qbuild.append(SinglefileData, filters={
+        'extras.' + SHA256_EXTRA: sha256,
+        'attributes.filename': filename,
+    })
+    found = qbuild.first()
+    if found is not None:
+        return found[0]
+
+    # tag before storing, so that a stored node always carries the extra it is looked up by
+    node = SinglefileData(file=os.path.abspath(path))
+    node.set_extra(SHA256_EXTRA, sha256)
+    return node.store()
+
+
+def get_or_create_structure(atoms):
+    """Return a stored StructureData equivalent to the ASE ``atoms``.
+
+    The node is looked up by the SHA-256 of its attributes (cell, pbc, kinds and sites), so
+    that running the same example repeatedly does not store a new identical structure every time.
+
+    :param atoms: an `ase.Atoms` object
+    :return: a stored `aiida.orm.StructureData` node
+    """
+    structure = StructureData(ase=atoms)
+    sha256 = hashlib.sha256(json.dumps(structure.attributes, sort_keys=True).encode('utf-8')).hexdigest()
+
+    qbuild = QueryBuilder()
+    qbuild.append(StructureData, filters={'extras.' + STRUCTURE_SHA256_EXTRA: sha256})
+    found = qbuild.first()
+    if found is not None:
+        return found[0]
+
+    structure.set_extra(STRUCTURE_SHA256_EXTRA, sha256)
+    return structure.store()
@@ -13,18 +13,21 @@ from __future__ import absolute_import
 import os
 import re
 import sys
-from copy import deepcopy
 import click
 
 import ase.build
 
-from aiida.orm import (Code, Dict, SinglefileData, StructureData)
+from aiida.orm import (Code, Dict, StructureData)
 from aiida.engine import run
 from aiida.common import NotExistent
 from aiida.plugins import CalculationFactory
 
+from aiida_cp2k.utils import get_or_create_singlefile
+
 Cp2kCalculation = CalculationFactory('cp2k')
 
+OVERWRITING_COORDS_RE = re.compile(r"WARNING .* :: Overwriting coordinates")
+
 
 def example_restart(cp2k_code):
     """Test CP2K restart"""
@@ -33,16 +36,16 @@ def example_restart(cp2k_code):
 
     pwd = os.path.dirname(os.path.realpath(__file__))
 
-    # structure
-    atoms1 = ase.build.molecule('H2O')
-    atoms1.center(vacuum=2.0)
-    structure1 = StructureData(ase=atoms1)
+    # structure, built once and reused for the second calculation
+    atoms = ase.build.molecule('H2O')
+    atoms.center(vacuum=2.0)
+    structure1 = StructureData(ase=atoms.copy())
 
     # basis set
-    basis_file = SinglefileData(file=os.path.join(pwd, "..", "files", "BASIS_MOLOPT"))
+    basis_file = get_or_create_singlefile(os.path.join(pwd, "..", "files", "BASIS_MOLOPT"))
 
     # pseudopotentials
-    pseudo_file = SinglefileData(file=os.path.join(pwd, "..", "files", "GTH_POTENTIALS"))
+    pseudo_file = get_or_create_singlefile(os.path.join(pwd, "..", "files", "GTH_POTENTIALS"))
 
     # CP2K input
     params1 = Dict(
@@ -136,20 +139,21 @@ def example_restart(cp2k_code):
     # ------------------------------------------------------------------------------
     # Set up and start the second calculation
 
-    # parameters
-    params2 = deepcopy(params1.get_dict())
-    del params2['GLOBAL']['WALLTIME']
-    del params2['MOTION']['GEO_OPT']['MAX_FORCE']
+    # parameters: get_dict() already returns a fresh copy, so only the modified sections are copied
+    params2 = params1.get_dict()
+    params2['GLOBAL'] = {k: v for k, v in params2['GLOBAL'].items() if k != 'WALLTIME'}
+    geo_opt = {k: v for k, v in params2['MOTION']['GEO_OPT'].items() if k != 'MAX_FORCE'}
+    params2['MOTION'] = dict(params2['MOTION'], GEO_OPT=geo_opt)
     restart_wfn_fn = './parent_calc/aiida-RESTART.wfn'
-    params2['FORCE_EVAL']['DFT']['RESTART_FILE_NAME'] = restart_wfn_fn
-    params2['FORCE_EVAL']['DFT']['SCF']['SCF_GUESS'] = 'RESTART'
+    dft = dict(params2['FORCE_EVAL']['DFT'], RESTART_FILE_NAME=restart_wfn_fn)
+    dft['SCF'] = dict(dft['SCF'], SCF_GUESS='RESTART')
+    params2['FORCE_EVAL'] = dict(params2['FORCE_EVAL'], DFT=dft)
     params2['EXT_RESTART'] = {'RESTART_FILE_NAME': './parent_calc/aiida-1.restart'}
     params2 = Dict(dict=params2)
 
     # structure
-    atoms2 = ase.build.molecule('H2O')
-    atoms2.center(vacuum=2.0)
-    atoms2.positions *= 0.0  # place all atoms at origin -> nuclear fusion :-)
+    atoms2 = atoms.copy()
+    atoms2.positions[:] = 0.0  # place all atoms at origin -> nuclear fusion :-)
     structure2 = StructureData(ase=atoms2)
 
     # Update the process builder.
@@ -169,8 +173,8 @@ def example_restart(cp2k_code):
     assert calc2['output_parameters'].dict.nwarnings == 1
 
     # ensure that this warning originates from overwritting coordinates
-    output = calc2['retrieved']._repository.get_object_content('aiida.out')  # pylint: disable=protected-access
-    assert re.search("WARNING .* :: Overwriting coordinates", output)
+    with calc2['retrieved'].open('aiida.out') as fobj:
+        assert any(OVERWRITING_COORDS_RE.search(line) for line in fobj)
 
 
 @click.command('cli')
@@ -13,16 +13,66 @@ from __future__ import absolute_import
 
 import os
 import sys
+from copy import deepcopy
 import ase.build
 import click
 
 from aiida.engine import run
-from aiida.orm import (Code, Dict, SinglefileData, StructureData)
+from aiida.orm import (Code, Dict, StructureData)
 from aiida.common import NotExistent
 from aiida.plugins import CalculationFactory
 
+from aiida_cp2k.utils import get_or_create_singlefile
+
 Cp2kCalculation = CalculationFactory('cp2k')
 
+PARAMETERS = {
+    'FORCE_EVAL': {
+        'METHOD': 'Quickstep',
+        'DFT': {
+            'BASIS_SET_FILE_NAME': 'BASIS_MOLOPT',
+            'POTENTIAL_FILE_NAME': 'GTH_POTENTIALS',
+            'QS': {
+                'EPS_DEFAULT': 1.0e-12,
+                'WF_INTERPOLATION': 'ps',
+                'EXTRAPOLATION_ORDER': 3,
+            },
+            'MGRID': {
+                'NGRIDS': 4,
+                'CUTOFF': 280,
+                'REL_CUTOFF': 30,
+            },
+            'XC': {
+                'XC_FUNCTIONAL': {
+                    '_': 'LDA',
+                },
+            },
+            'POISSON': {
+                'PERIODIC': 'none',
+                'PSOLVER': 'MT',
+            },
+        },
+        'SUBSYS': {
+            'TOPOLOGY': {
+                'COORD_FILE_NAME': 'water.xyz',
+                'COORD_FILE_FORMAT': 'XYZ'
+            },
+            'KIND': [
+                {
+                    '_': 'O',
+                    'BASIS_SET': 'DZVP-MOLOPT-SR-GTH',
+                    'POTENTIAL': 'GTH-LDA-q6'
+                },
+                {
+                    '_': 'H',
+                    'BASIS_SET': 'DZVP-MOLOPT-SR-GTH',
+                    'POTENTIAL': 'GTH-LDA-q1'
+                },
+            ],
+        },
+    }
+}
+
 
 def example_structure_through_file(cp2k_code):
     """Run simple DFT calculation"""
@@ -37,62 +87,15 @@ def example_structure_through_file(cp2k_code):
     structure = StructureData(ase=atoms)
 
     # basis set
-    basis_file = SinglefileData(file=os.path.join(pwd, "..", "files", "BASIS_MOLOPT"))
+    basis_file = get_or_create_singlefile(os.path.join(pwd, "..", "files", "BASIS_MOLOPT"))
 
     # pseudopotentials
-    pseudo_file = SinglefileData(file=os.path.join(pwd, "..", "files", "GTH_POTENTIALS"))
-
-    # parameters
-    parameters = Dict(
-        dict={
-            'FORCE_EVAL': {
-                'METHOD': 'Quickstep',
-                'DFT': {
-                    'BASIS_SET_FILE_NAME': 'BASIS_MOLOPT',
-                    'POTENTIAL_FILE_NAME': 'GTH_POTENTIALS',
-                    'QS': {
-                        'EPS_DEFAULT': 1.0e-12,
-                        'WF_INTERPOLATION': 'ps',
-                        'EXTRAPOLATION_ORDER': 3,
-                    },
-                    'MGRID': {
-                        'NGRIDS': 4,
-                        'CUTOFF': 280,
-                        'REL_CUTOFF': 30,
-                    },
-                    'XC': {
-                        'XC_FUNCTIONAL': {
-                            '_': 'LDA',
-                        },
-                    },
-                    'POISSON': {
-                        'PERIODIC': 'none',
-                        'PSOLVER': 'MT',
-                    },
-                },
-                'SUBSYS': {
-                    'TOPOLOGY': {
-                        'COORD_FILE_NAME': 'water.xyz',
-                        'COORD_FILE_FORMAT': 'XYZ'
-                    },
-                    'CELL': {
-                        'ABC': '{:<15}  {:<15}  {:<15}'.format(*atoms.cell.diagonal()),
-                    },
-                    'KIND': [
-                        {
-                            '_': 'O',
-                            'BASIS_SET': 'DZVP-MOLOPT-SR-GTH',
-                            'POTENTIAL': 'GTH-LDA-q6'
-                        },
-                        {
-                            '_': 'H',
-                            'BASIS_SET': 'DZVP-MOLOPT-SR-GTH',
-                            'POTENTIAL': 'GTH-LDA-q1'
-                        },
-                    ],
-                },
-            }
-        })
+    pseudo_file = get_or_create_singlefile(os.path.join(pwd, "..", "files", "GTH_POTENTIALS"))
+
+    # parameters: work on a copy so that the module-level PARAMETERS are never modified
+    params = deepcopy(PARAMETERS)
+    params['FORCE_EVAL']['SUBSYS']['CELL'] = {'ABC': '{:<15}  {:<15}  {:<15}'.format(*atoms.cell.diagonal())}
+    parameters = Dict(dict=params)
 
     # Construct process builder
     builder = Cp2kCalculation.get_builder()
@@ -13,79 +13,82 @@ from __future__ import absolute_import
 
 import os
 import sys
+from copy import deepcopy
 import ase.build
 import click
 
 from aiida.engine import run
-from aiida.orm import (Code, Dict, SinglefileData, StructureData)
+from aiida.orm import (Code, Dict, StructureData)
 from aiida.common import NotExistent
 from aiida.plugins import WorkflowFactory
 
+from aiida_cp2k.utils import get_or_create_singlefile
+from submission import run_or_submit, submission_options
+
 Cp2kBaseWorkChain = WorkflowFactory('cp2k.base')
 
+PARAMETERS = {
+    'FORCE_EVAL': {
+        'METHOD': 'Quickstep',
+        'DFT': {
+            'BASIS_SET_FILE_NAME': 'BASIS_MOLOPT',
+            'POTENTIAL_FILE_NAME': 'GTH_POTENTIALS',
+            'QS': {
+                'EPS_DEFAULT': 1.0e-12,
+                'WF_INTERPOLATION': 'ps',
+                'EXTRAPOLATION_ORDER': 3,
+            },
+            'MGRID': {
+                'NGRIDS': 4,
+                'CUTOFF': 280,
+                'REL_CUTOFF': 30,
+            },
+            'XC': {
+                'XC_FUNCTIONAL': {
+                    '_': 'LDA',
+                },
+            },
+            'POISSON': {
+                'PERIODIC': 'none',
+                'PSOLVER': 'MT',
+            },
+        },
+        'SUBSYS': {
+            'KIND': [
+                {
+                    '_': 'O',
+                    'BASIS_SET': 'DZVP-MOLOPT-SR-GTH',
+                    'POTENTIAL': 'GTH-LDA-q6'
+                },
+                {
+                    '_': 'H',
+                    'BASIS_SET': 'DZVP-MOLOPT-SR-GTH',
+                    'POTENTIAL': 'GTH-LDA-q1'
+                },
+            ],
+        },
+    }
+}
+
 
-def example_base(cp2k_code):
-    """Run simple DFT calculation through a workchain"""
+def get_builder(cp2k_code):
+    """Construct the process builder of the example workchain"""
 
     pwd = os.path.dirname(os.path.realpath(__file__))
 
-    print("Testing CP2K ENERGY on H2O (DFT) through a workchain...")
-
     # basis set
-    basis_file = SinglefileData(file=os.path.join(pwd, "..", "files", "BASIS_MOLOPT"))
+    basis_file = get_or_create_singlefile(os.path.join(pwd, "..", "files", "BASIS_MOLOPT"))
 
     # pseudopotentials
-    pseudo_file = SinglefileData(file=os.path.join(pwd, "..", "files", "GTH_POTENTIALS"))
+    pseudo_file = get_or_create_singlefile(os.path.join(pwd, "..", "files", "GTH_POTENTIALS"))
 
     # structure
     atoms = ase.build.molecule('H2O')
     atoms.center(vacuum=2.0)
     structure = StructureData(ase=atoms)
 
-    # parameters
-    parameters = Dict(
-        dict={
-            'FORCE_EVAL': {
-                'METHOD': 'Quickstep',
-                'DFT': {
-                    'BASIS_SET_FILE_NAME': 'BASIS_MOLOPT',
-                    'POTENTIAL_FILE_NAME': 'GTH_POTENTIALS',
-                    'QS': {
-                        'EPS_DEFAULT': 1.0e-12,
-                        'WF_INTERPOLATION': 'ps',
-                        'EXTRAPOLATION_ORDER': 3,
-                    },
-                    'MGRID': {
-                        'NGRIDS': 4,
-                        'CUTOFF': 280,
-                        'REL_CUTOFF': 30,
-                    },
-                    'XC': {
-                        'XC_FUNCTIONAL': {
-                            '_': 'LDA',
-                        },
-                    },
-                    'POISSON': {
-                        'PERIODIC': 'none',
-                        'PSOLVER': 'MT',
-                    },
-                },
-                'SUBSYS': {
-                    'KIND': [
-                        {
-                            '_': 'O',
-                            'BASIS_SET': 'DZVP-MOLOPT-SR-GTH',
-                            'POTENTIAL': 'GTH-LDA-q6'
-                        },
-                        {
-                            '_': 'H',
-                            'BASIS_SET': 'DZVP-MOLOPT-SR-GTH',
-                            'POTENTIAL': 'GTH-LDA-q1'
-                        },
-                    ],
-                },
-            }
-        })
+    # parameters: the unstored Dict keeps references, so pass a copy to protect the module-level PARAMETERS
+    parameters = Dict(dict=deepcopy(PARAMETERS))
 
     # Construct process builder
     builder = Cp2kBaseWorkChain.get_builder()
@@ -102,20 +105,31 @@ def example_base(cp2k_code):
     }
     builder.cp2k.metadata.options.max_wallclock_seconds = 1 * 3 * 60
 
+    return builder
+
+
+def example_base(cp2k_code):
+    """Run simple DFT calculation through a workchain"""
+
+    print("Testing CP2K ENERGY on H2O (DFT) through a workchain...")
+
+    builder = get_builder(cp2k_code)
+
     print("Submitted calculation...")
     run(builder)
 
 
 @click.command('cli')
 @click.argument('codelabel')
-def cli(codelabel):
+@submission_options
+def cli(codelabel, use_async, count, timeout):
     """Click interface"""
     try:
         code = Code.get_from_string(codelabel)
     except NotExistent:
         print("The code '{}' does not exist".format(codelabel))
         sys.exit(1)
-    example_base(code)
+    run_or_submit(example_base, get_builder, code, use_async, count, timeout)
 
 
 if __name__ == '__main__':
@@ -15,25 +15,33 @@ from aiida.orm import Code, StructureData, SinglefileData
 from aiida.common import NotExistent
 from aiida.plugins import WorkflowFactory
 
-Cp2kMultistageWorkChain = WorkflowFactory('cp2k.multistage')
+from aiida_cp2k.utils import get_or_create_singlefile, get_or_create_structure
+from submission import run_or_submit, submission_options
 
+Cp2kMultistageWorkChain = WorkflowFactory('cp2k.multistage')
 
-def example_multistage_h2o_testfile(cp2k_code):
-    """Example usage: verdi run thistest.py cp2k@localhost"""
 
-    print("Testing CP2K multistage workchain on H2O")
-    print(">>> Loading a custom protocol from file testfile.yaml")
+def get_builder(cp2k_code):
+    """Construct the process builder of the example workchain"""
 
     atoms = ase.build.molecule('H2O')
     atoms.center(vacuum=2.0)
-    structure = StructureData(ase=atoms)
 
     thisdir = os.path.dirname(os.path.abspath(__file__))
+    protocol_file = os.path.join(thisdir, '..', 'data', 'testfile.yaml')
+
+    # reuse already stored input nodes only on request, so that by default every run gets its own inputs
+    if os.environ.get('AIIDA_CP2K_EXAMPLES_CACHE') == '1':
+        structure = get_or_create_structure(atoms)
+        protocol_yaml = get_or_create_singlefile(protocol_file)
+    else:
+        structure = StructureData(ase=atoms)
+        protocol_yaml = SinglefileData(file=os.path.abspath(protocol_file))
 
     # Construct process builder
     builder = Cp2kMultistageWorkChain.get_builder()
     builder.structure = structure
-    builder.protocol_yaml = SinglefileData(file=os.path.abspath(os.path.join(thisdir, '..', 'data', 'testfile.yaml')))
+    builder.protocol_yaml = protocol_yaml
     builder.cp2k_base.cp2k.code = cp2k_code
     builder.cp2k_base.cp2k.metadata.options.resources = {
         "num_machines": 1,
@@ -41,19 +49,29 @@ def example_multistage_h2o_testfile(cp2k_code):
     }
     builder.cp2k_base.cp2k.metadata.options.max_wallclock_seconds = 1 * 3 * 60
 
-    run(builder)
+    return builder
+
+
+def example_multistage_h2o_testfile(cp2k_code):
+    """Example usage: verdi run thistest.py cp2k@localhost"""
+
+    print("Testing CP2K multistage workchain on H2O")
+    print(">>> Loading a custom protocol from file testfile.yaml")
+
+    run(get_builder(cp2k_code))
 
 
 @click.command('cli')
 @click.argument('codelabel')
-def cli(codelabel):
+@submission_options
+def cli(codelabel, use_async, count, timeout):
     """Click interface"""
     try:
         code = Code.get_from_string(codelabel)
     except NotExistent:
         print("The code '{}' does not exist".format(codelabel))
         sys.exit(1)
-    example_multistage_h2o_testfile(code)
+    run_or_submit(example_multistage_h2o_testfile, get_builder, code, use_async, count, timeout)
 
 
 if __name__ == '__main__':
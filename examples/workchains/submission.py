@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), The AiiDA-CP2K authors.                                      #
+# SPDX-License-Identifier: MIT                                                #
+# AiiDA-CP2K is hosted on GitHub at https://github.com/aiidateam/aiida-cp2k   #
+# For further information on the license, see the LICENSE.txt file.           #
+###############################################################################
+"""Helpers shared by the workchain examples to submit batches of workchains to the daemon"""
+
+from __future__ import print_function
+from __future__ import absolute_import
+
+import sys
+import time
+import functools
+
+import click
+
+from aiida.engine import submit
+from aiida.engine.daemon.client import get_daemon_client
+
+
+def submit_and_wait(builders, timeout=None, poll_interval=0.2):
+    """Submit all builders to the daemon first, then wait until all of them are terminated.
+
+    :param builders: list of process builders
+    :param timeout: maximum time to wait in seconds, wait indefinitely if None
+    :param poll_interval: time between two checks of the process states in seconds
+    :return: list of the submitted process nodes
+    :raises RuntimeError: if the daemon is not running or the timeout is exceeded
+    """
+    if not get_daemon_client().is_daemon_running:
+        raise RuntimeError("The daemon is not running: start it with 'verdi daemon start'")
+
+    nodes = [submit(builder) for builder in builders]
+    start = time.time()
+    while not all(node.is_terminated for node in nodes):
+        if timeout is not None and time.time() - start > timeout:
+            raise RuntimeError("Processes {} did not terminate within {} s".format(
+                ", ".join(str(node.pk) for node in nodes if not node.is_terminated), timeout))
+        time.sleep(poll_interval)
+    return nodes
+
+
+def run_or_submit(example, get_builder, code, use_async, count, timeout):
+    """Run the example in the interpreter, or submit count builders to the daemon and wait for them"""
+    if not use_async:
+        example(code)
+        return
+
+    print("Submitting {} workchain(s) to the daemon...".format(count))
+    try:
+        nodes = submit_and_wait([get_builder(code) for _ in range(count)], timeout=timeout)
+    except RuntimeError as exc:
+        print(exc)
+        sys.exit(1)
+    print("Finished: {}".format(", ".join(str(node.pk) for node in nodes)))
+
+
+def submission_options(func):
+    """Decorator adding the --async, --count and --timeout options to a click command"""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not kwargs['use_async']:
+            for option in ['count', 'timeout']:
+                if kwargs[option] is not None:
+                    raise click.UsageError("--{} can only be used together with --async".format(option))
+        if kwargs['count'] is None:
+            kwargs['count'] = 1
+        return func(*args, **kwargs)
+
+    wrapper = click.option('--timeout',
+                           type=click.FloatRange(0),
+                           default=None,
+                           help='Maximum time to wait in seconds (requires --async)')(wrapper)
+    wrapper = click.option('--count',
+                           type=click.IntRange(1),
+                           default=None,
+                           help='Number of workchains to submit (requires --async)')(wrapper)
+    wrapper = click.option('--async',
+                           'use_async',
+                           is_flag=True,
+                           help='Submit to the daemon instead of running in the interpreter')(wrapper)
+    return wrapper
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+###############################################################################
+# Copyright (c), The AiiDA-CP2K authors.                                      #
+# SPDX-License-Identifier: MIT                                                #
+# AiiDA-CP2K is hosted on GitHub at https://github.com/cp2k/aiida-cp2k        #
+# For further information on the license, see the LICENSE.txt file.           #
+###############################################################################
+"""Test helpers to reuse stored data nodes"""
+
+from __future__ import absolute_import
+
+import os
+
+import ase.build
+
+from aiida_cp2k.utils import get_or_create_singlefile, get_or_create_structure
+
+FILES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "examples", "files")
+
+
+def test_get_or_create_singlefile(aiida_profile):  # pylint: disable=unused-argument
+    """Test that the same file is stored only once"""
+    path = os.path.join(FILES_DIR, "BASIS_MOLOPT")
+    node1 = get_or_create_singlefile(path)
+    node2 = get_or_create_singlefile(path)
+    assert node1.is_stored
+    assert node1.uuid == node2.uuid
+    assert node1.filename == "BASIS_MOLOPT"
+
+    other = get_or_create_singlefile(os.path.join(FILES_DIR, "GTH_POTENTIALS"))
+    assert other.uuid != node1.uuid
+
+
+def test_get_or_create_structure(aiida_profile):  # pylint: disable=unused-argument
+    """Test that an identical structure is stored only once"""
+    atoms = ase.build.molecule('H2O')
+    atoms.center(vacuum=2.0)
+    node1 = get_or_create_structure(atoms)
+    node2 = get_or_create_structure(atoms.copy())
+    assert node1.is_stored
+    assert node1.uuid == node2.uuid
+
+    atoms.positions *= 0.0
+    assert get_or_create_structure(atoms).uuid != node1.uuid